@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import orjson
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # optional: fall back to the in-process store
+    redis = None
+
+
+REDIS_URL = os.getenv("REDIS_URL")
+# A stalled Redis host should cost a fraction of a second, then count as a miss.
+REDIS_TIMEOUT_S = 0.5
+# After a failure, skip Redis for this long rather than pay the timeout on every call.
+REDIS_BACKOFF_S = 5.0
+
+# Bounds for the in-process fallback; least recently used entries go first.
+LOCAL_MAX_ENTRIES = 512
+LOCAL_MAX_BYTES = 64 * 1024 * 1024
+
+_redis: Optional["redis.Redis"] = None
+_redis_down_until = 0.0  # monotonic seconds
+# key -> (expires_at monotonic seconds, orjson-encoded value), in LRU order
+_local: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+_local_bytes = 0
+
+
+def _get_redis() -> Optional["redis.Redis"]:
+    """Return the shared Redis client, or None when REDIS_URL is unset or redis isn't installed."""
+    global _redis
+    if redis is None or not REDIS_URL:
+        return None
+    if _redis is None:
+        _redis = redis.Redis.from_url(
+            REDIS_URL,
+            socket_connect_timeout=REDIS_TIMEOUT_S,
+            socket_timeout=REDIS_TIMEOUT_S,
+        )
+    return _redis
+
+
+def _redis_down() -> bool:
+    return time.monotonic() < _redis_down_until
+
+
+def _mark_redis_down() -> None:
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_BACKOFF_S
+
+
+async def get_json(key: str) -> Any:
+    """Return the cached value for `key`, or None on a miss (or if Redis is unreachable)."""
+    r = _get_redis()
+    if r is not None:
+        if _redis_down():
+            return None
+        try:
+            raw = await r.get(key)
+            return orjson.loads(raw) if raw is not None else None
+        except orjson.JSONDecodeError:
+            # A corrupt value is a miss; the next set_json overwrites it.
+            return None
+        except Exception:
+            _mark_redis_down()
+            return None
+
+    hit = _local.get(key)
+    if hit is None:
+        return None
+    expires_at, raw = hit
+    if expires_at < time.monotonic():
+        _local_drop(key)
+        return None
+    _local.move_to_end(key)
+    return orjson.loads(raw)
+
+
+async def set_json(key: str, val: Any, ttl: int) -> None:
+    """Store `val` under `key` for `ttl` seconds. Cache errors never fail the caller."""
+    raw = orjson.dumps(val)
+    r = _get_redis()
+    if r is not None:
+        if _redis_down():
+            return
+        try:
+            await r.set(key, raw, ex=ttl)
+        except Exception:
+            _mark_redis_down()
+        return
+    _local_put(key, raw, ttl)
+
+
+def _local_drop(key: str) -> None:
+    global _local_bytes
+    hit = _local.pop(key, None)
+    if hit is not None:
+        _local_bytes -= len(hit[1])
+
+
+def _local_put(key: str, raw: bytes, ttl: int) -> None:
+    global _local_bytes
+    _local_drop(key)
+    if len(raw) > LOCAL_MAX_BYTES:
+        return
+    _local[key] = (time.monotonic() + ttl, raw)
+    _local_bytes += len(raw)
+    while len(_local) > LOCAL_MAX_ENTRIES or _local_bytes > LOCAL_MAX_BYTES:
+        _, (_, old) = _local.popitem(last=False)
+        _local_bytes -= len(old)
+
+
+async def warmup() -> None:
+    """Open the Redis connection ahead of the first request, if Redis is configured."""
+    r = _get_redis()
+    if r is not None:
+        try:
+            await r.ping()
+        except Exception:
+            _mark_redis_down()
+
+
+async def shutdown() -> None:
+    """Close the Redis connection pool (call on app teardown)."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
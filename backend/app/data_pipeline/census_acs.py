@@ -1,9 +1,16 @@
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import os
+import sys
+import time
 import httpx
+import numpy as np
+import orjson
 
-from ..sim.agent import District, Issue
+from ..sim.agent import District
+from ..sim.issues import ISSUE_ORDER, Issue, IssueIdx
 
 
 DEFAULT_ACS_VARS: List[str] = [
@@ -15,8 +22,42 @@ DEFAULT_ACS_VARS: List[str] = [
 ]
 
 
-def _clamp(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, x))
+# ACS 5-year vintages are immutable once released, so responses are cached on disk.
+ACS_CACHE_DIR = os.getenv("ACS_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "congress-sim", "acs"))
+ACS_CACHE_TTL_S = 30 * 86400
+
+
+def _deterministic_lean(key: str) -> float:
+    """Stable pseudo-random lean in [-0.8, 0.8) derived from a hash of `key`."""
+    h = int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+    return (h / 2**64) * 1.6 - 0.8
+
+
+def _cache_path(year: int, state_fips: Optional[str], variables: List[str]) -> str:
+    key = repr((year, state_fips, sorted(variables)))
+    return os.path.join(ACS_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def _cache_load(path: str) -> Optional[List[Dict[str, str]]]:
+    try:
+        if time.time() - os.path.getmtime(path) > ACS_CACHE_TTL_S:
+            return None
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def _cache_store(path: str, rows: List[Dict[str, str]]) -> None:
+    # Best effort: a read-only or full disk just means no caching.
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(rows))
+        os.replace(tmp, path)
+    except OSError:
+        pass
 
 
 async def fetch_acs5_congressional_districts(
@@ -24,15 +65,22 @@ async def fetch_acs5_congressional_districts(
     state_fips: Optional[str] = None,
     variables: Optional[List[str]] = None,
     timeout_s: float = 60.0,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> List[Dict[str, str]]:
     """Fetch ACS 5-year estimates at the congressional district geography.
 
     Uses the Census Data API. Example queries are documented by the Census API itself.
+    Results are cached under ACS_CACHE_DIR for ACS_CACHE_TTL_S seconds.
     """
     vars_ = variables or DEFAULT_ACS_VARS
     if "NAME" not in vars_:
         vars_ = ["NAME"] + vars_
 
+    cache_path = _cache_path(year, state_fips, vars_)
+    cached = _cache_load(cache_path)
+    if cached is not None:
+        return cached
+
     url = f"https://api.census.gov/data/{year}/acs/acs5"
     params = {
         "get": ",".join(vars_),
@@ -41,24 +89,30 @@ async def fetch_acs5_congressional_districts(
     if state_fips:
         params["in"] = f"state:{state_fips}"
 
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        data = r.json()
+    if client is not None:
+        r = await client.get(url, params=params, timeout=timeout_s)
+    else:
+        async with httpx.AsyncClient(timeout=timeout_s) as c:
+            r = await c.get(url, params=params)
+    r.raise_for_status()
+    data = orjson.loads(r.content)
 
     if not data or len(data) < 2:
         return []
 
-    header = data[0]
-    rows = data[1:]
+    # Interned header keys are shared by every row dict; zip stops at the shorter side.
+    header = [sys.intern(h) for h in data[0]]
+    out: List[Dict[str, str]] = [dict(zip(header, row)) for row in data[1:]]
 
-    out: List[Dict[str, str]] = []
-    for row in rows:
-        rec = {header[i]: row[i] for i in range(min(len(header), len(row)))}
-        out.append(rec)
+    _cache_store(cache_path, out)
     return out
 
 
+def _column(rows: List[Dict[str, str]], key: str) -> np.ndarray:
+    # Census values arrive as strings; numpy parses them in one pass.
+    return np.array([rec.get(key) or "0" for rec in rows], dtype=np.float64)
+
+
 def acs_rows_to_districts(
     rows: List[Dict[str, str]],
     *,
@@ -76,45 +130,40 @@ def acs_rows_to_districts(
         "education": 0.15,
     }
 
+    # Numeric columns as arrays so the derived features are computed column-wise.
+    pop = _column(rows, "B01001_001E").astype(np.int64)
+    med_income = _column(rows, "B19013_001E")
+    pov_universe = _column(rows, "B17001_001E")
+    pov_count = _column(rows, "B17001_002E")
+
+    poverty_rate = np.divide(pov_count, pov_universe, out=np.zeros_like(pov_count), where=pov_universe > 0)
+
+    # Conservative-ish defaults: keep weights stable and explainable.
+    # You can plug in better mappings later.
+    W = np.tile(np.array([scenario[k] for k in ISSUE_ORDER], dtype=np.float64), (len(rows), 1))
+    econ, edu, health = IssueIdx.ECONOMY, IssueIdx.EDUCATION, IssueIdx.HEALTHCARE
+
+    # Small tweaks based on poverty/income so that different districts do differ.
+    has_income = med_income > 0
+    income_norm = np.minimum(1.0, med_income / 100000.0)  # ~0..1
+    W[:, econ] = np.where(has_income, np.clip(W[:, econ] + 0.10 * (1 - income_norm), 0.05, 0.60), W[:, econ])
+    W[:, edu] = np.where(has_income, np.clip(W[:, edu] + 0.05 * income_norm, 0.05, 0.50), W[:, edu])
+    W[:, health] = np.clip(W[:, health] + 0.08 * poverty_rate, 0.05, 0.60)
+
+    # Normalize to sum to 1.
+    s = W.sum(axis=1, keepdims=True)
+    W /= np.where(s > 0, s, 1.0)
+
     districts: List[District] = []
-    for rec in rows:
+    for rec, p, inc, pov, w in zip(rows, pop.tolist(), med_income.tolist(), poverty_rate.tolist(), W.tolist()):
         state_fips = rec.get("state")
         cd = rec.get("congressional district")
         name = rec.get("NAME") or f"State {state_fips} CD {cd}"
-        pop = int(float(rec.get("B01001_001E", "0") or 0))
-        med_income = float(rec.get("B19013_001E", "0") or 0)
-        pov_universe = float(rec.get("B17001_001E", "0") or 0)
-        pov_count = float(rec.get("B17001_002E", "0") or 0)
-
-        poverty_rate = (pov_count / pov_universe) if pov_universe > 0 else 0.0
-
-        # Lightweight, transparent derived features.
-        demographics = {
-            "median_income": med_income,
-            "poverty_rate": poverty_rate,
-        }
-
-        # Conservative-ish defaults: keep weights stable and explainable.
-        # You can plug in better mappings later.
-        weights: Dict[Issue, float] = dict(scenario)
-
-        # Small tweaks based on poverty/income so that different districts do differ.
-        if med_income > 0:
-            income_norm = min(1.0, med_income / 100000.0)  # ~0..1
-            weights["economy"] = _clamp(weights["economy"] + 0.10 * (1 - income_norm), 0.05, 0.60)
-            weights["education"] = _clamp(weights["education"] + 0.05 * income_norm, 0.05, 0.50)
-        weights["healthcare"] = _clamp(weights["healthcare"] + 0.08 * poverty_rate, 0.05, 0.60)
-
-        # Normalize to sum to 1.
-        s = sum(weights.values()) or 1.0
-        weights = {k: float(v) / s for k, v in weights.items()}
 
         district_id = f"{state_fips}-{cd}"
         # Heuristic Lean: Deterministic random based on ID to ensure agents have opinions.
         # (Real election data loading is a future step, this prevents mass abstention)
-        import random
-        rng = random.Random(district_id)
-        lean = _clamp(rng.uniform(-0.8, 0.8))
+        lean = _deterministic_lean(district_id)
 
         districts.append(
             District(
@@ -123,9 +172,10 @@ def acs_rows_to_districts(
                 state_fips=state_fips,
                 cd=cd,
                 lean=lean,
-                population=pop,
-                demographics=demographics,
-                weights=weights,
+                population=p,
+                # Lightweight, transparent derived features.
+                demographics={"median_income": inc, "poverty_rate": pov},
+                weights=dict(zip(ISSUE_ORDER, w)),
             )
         )
 
@@ -1,21 +1,83 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+import asyncio
+import itertools
 import os
+import random
 import re
 import httpx
+import msgspec
+
+try:
+    import ahocorasick
+except ImportError:  # optional: keyword scan falls back to compiled regexes
+    ahocorasick = None
 
 from ..models import Bill
+from .file_parser import html_to_text, run_parser
 from ..sim.agent import Issue
 
 
 DEFAULT_BASE = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
 
+# Congress.gov caps `limit` on list endpoints at 250.
+RECENT_BILLS_PAGE_SIZE = 250
+
+
+# Typed views of the parts of the bill response we read; unknown fields are ignored.
+class Summary(msgspec.Struct):
+    text: Optional[str] = None
+
+
+class Summaries(msgspec.Struct):
+    count: int = 0
+    summaries: List[Summary] = []
+
+
+class LatestAction(msgspec.Struct):
+    text: Optional[str] = None
+
+
+class BillPayload(msgspec.Struct):
+    title: Optional[str] = None
+    shortTitle: Optional[str] = None
+    number: Optional[Union[str, int]] = None
+    summaries: Optional[Summaries] = None
+    latestAction: Optional[LatestAction] = None
+
+
+class BillResponse(msgspec.Struct):
+    bill: Optional[BillPayload] = None
+
 
 def _clamp(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, x))
 
 
+async def _get_bill(
+    congress: int,
+    bill_type: str,
+    bill_number: str,
+    api_key: str,
+    base_url: str,
+    timeout_s: float,
+    client: Optional[httpx.AsyncClient],
+) -> httpx.Response:
+    """GET /bill/{congress}/{type}/{number}; shared by fetch_bill_json and fetch_bill."""
+    url = f"{base_url.rstrip('/')}/bill/{congress}/{bill_type.lower()}/{bill_number}"
+    params = {"format": "json", "api_key": api_key}
+
+    if client is not None:
+        r = await client.get(url, params=params, timeout=timeout_s)
+    else:
+        async with httpx.AsyncClient(timeout=timeout_s) as c:
+            r = await c.get(url, params=params)
+    # Error bodies (e.g. 429 OVER_RATE_LIMIT) must not pass for bill data.
+    r.raise_for_status()
+    return r
+
+
 async def fetch_bill_json(
     *,
     congress: int,
@@ -24,6 +86,7 @@ async def fetch_bill_json(
     api_key: str,
     base_url: str = DEFAULT_BASE,
     timeout_s: float = 20.0,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> Dict[str, Any]:
     """Fetch a single bill from the Congress.gov v3 API.
 
@@ -31,13 +94,26 @@ async def fetch_bill_json(
     - https://api.congress.gov/v3
     - https://api.data.gov/congress/v3
     """
-    bill_type = bill_type.lower()
-    url = f"{base_url.rstrip('/')}/bill/{congress}/{bill_type}/{bill_number}"
-    params = {"format": "json", "api_key": api_key}
+    r = await _get_bill(congress, bill_type, bill_number, api_key, base_url, timeout_s, client)
+    return msgspec.json.decode(r.content)
+
+
+async def fetch_bill(
+    *,
+    congress: int,
+    bill_type: str,
+    bill_number: str,
+    api_key: str,
+    base_url: str = DEFAULT_BASE,
+    timeout_s: float = 20.0,
+    client: Optional[httpx.AsyncClient] = None,
+) -> Optional[BillPayload]:
+    """Like fetch_bill_json, but decoded straight into a typed BillPayload.
 
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
-        r = await client.get(url, params=params)
-        return r.json()
+    Returns None when the response carries no `bill` (e.g. an API error body).
+    """
+    r = await _get_bill(congress, bill_type, bill_number, api_key, base_url, timeout_s, client)
+    return msgspec.json.decode(r.content, type=BillResponse).bill
 
 
 async def fetch_bill_text(
@@ -47,65 +123,73 @@ async def fetch_bill_text(
     bill_number: str,
     api_key: str,
     base_url: str = DEFAULT_BASE,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> Optional[str]:
     """Fetch text versions and return the latest one as a plain string (stripped)."""
     # https://api.congress.gov/v3/bill/{congress}/{billType}/{billNumber}/text
     url = f"{base_url.rstrip('/')}/bill/{congress}/{bill_type}/{bill_number}/text"
     params = {"format": "json", "api_key": api_key}
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(url, params=params)
-            r.raise_for_status()
-            data = r.json()
-            
-            # The API returns a list of text versions
-            texts = data.get("textVersions", [])
-            if not texts:
-                return None
-            
-            # Grab the last one (usually latest)
-            latest = texts[-1]
-            formats = latest.get("formats", [])
-            
-            text_url = None
-            for fmt in formats:
-                # Look for "Formatted Text" or "Text"
-                if fmt.get("type") == "Formatted Text" or fmt.get("type") == "Text":
-                    text_url = fmt.get("url")
-                    break
-            
-            if not text_url:
-                return None
-
-            # Fetch the actual HTML/XML content
-            # Note: This is an external link, usually to congress.gov, might not need API key?
-            # Usually these are public URLs.
-            tr = await client.get(text_url)
-            tr.raise_for_status()
-            raw_html = tr.text
-            
-            # Naive HTML stripping for MVP (avoiding beautifulsoup dependency)
-            # Remove scripts and styles first
-            no_script = re.sub(r'<(script|style)[^>]*>.*?</\1>', '', raw_html, flags=re.DOTALL)
-            # Remove tags
-            clean_text = re.sub(r'<[^>]+>', ' ', no_script)
-            # Normalize whitespace
-            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
-            
-            return clean_text
+        if client is not None:
+            raw_html = await _fetch_latest_text_html(client, url, params)
+        else:
+            async with httpx.AsyncClient(timeout=10.0) as c:
+                raw_html = await _fetch_latest_text_html(c, url, params)
+        if raw_html is None:
+            return None
+
+        # Parse off the event loop: large bills are tens of MB of HTML.
+        return await run_parser(_html_to_plain_text, raw_html)
     except Exception as e:
         print(f"Error fetching text: {e}")
         return None
 
 
-async def fetch_recent_bills(
+async def _fetch_latest_text_html(c: httpx.AsyncClient, url: str, params: Dict[str, str]) -> Optional[bytes]:
+    """Raw HTML of the bill's latest text version, or None if it has none."""
+    r = await c.get(url, params=params, timeout=10.0)
+    r.raise_for_status()
+    data = msgspec.json.decode(r.content)
+
+    # The API returns a list of text versions
+    texts = data.get("textVersions", [])
+    if not texts:
+        return None
+    
+    # Grab the last one (usually latest)
+    latest = texts[-1]
+    formats = latest.get("formats", [])
+    
+    text_url = None
+    for fmt in formats:
+        # Look for "Formatted Text" or "Text"
+        if fmt.get("type") == "Formatted Text" or fmt.get("type") == "Text":
+            text_url = fmt.get("url")
+            break
+    
+    if not text_url:
+        return None
+
+    # Fetch the actual HTML/XML content
+    # Note: This is an external link, usually to congress.gov, might not need API key?
+    # Usually these are public URLs.
+    tr = await c.get(text_url, timeout=10.0)
+    tr.raise_for_status()
+    return tr.content
+
+
+def _html_to_plain_text(raw_html: bytes) -> str:
+    # Strip tags, then normalize whitespace
+    return " ".join(html_to_text(raw_html, separator=" ").split())
+
+
+async def _fetch_recent_page(
+    c: httpx.AsyncClient,
+    url: str,
     api_key: str,
-    limit: int = 20,
-    offset: int = 0,
-    base_url: str = DEFAULT_BASE,
+    limit: int,
+    offset: int,
 ) -> list[dict]:
-    """Fetch a list of bills with pagination support."""
-    url = f"{base_url.rstrip('/')}/bill"
     params = {
         "format": "json",
         "api_key": api_key,
@@ -113,11 +197,51 @@ async def fetch_recent_bills(
         "offset": offset,
         "sort": "updateDate desc",
     }
-    async with httpx.AsyncClient() as client:
-        r = await client.get(url, params=params)
-        r.raise_for_status()
-        data = r.json()
-        return data.get("bills", [])
+    r = await c.get(url, params=params)
+    r.raise_for_status()
+    data = msgspec.json.decode(r.content)
+    return data.get("bills", [])
+
+
+async def fetch_recent_bills(
+    api_key: str,
+    limit: int = 20,
+    offset: int = 0,
+    base_url: str = DEFAULT_BASE,
+    client: Optional[httpx.AsyncClient] = None,
+    max_concurrency: int = 8,
+) -> list[dict]:
+    """Fetch a list of bills with pagination support.
+
+    Requests above RECENT_BILLS_PAGE_SIZE are split into pages fetched concurrently.
+    """
+    url = f"{base_url.rstrip('/')}/bill"
+    if client is not None:
+        return await _fetch_recent_pages(client, url, api_key, limit, offset, max_concurrency)
+    async with httpx.AsyncClient(http2=True, timeout=20.0) as c:
+        return await _fetch_recent_pages(c, url, api_key, limit, offset, max_concurrency)
+
+
+async def _fetch_recent_pages(
+    c: httpx.AsyncClient,
+    url: str,
+    api_key: str,
+    limit: int,
+    offset: int,
+    max_concurrency: int,
+) -> list[dict]:
+    if limit <= RECENT_BILLS_PAGE_SIZE:
+        return await _fetch_recent_page(c, url, api_key, limit, offset)
+
+    sem = asyncio.Semaphore(max_concurrency)
+    end = offset + limit
+
+    async def one(off: int) -> list[dict]:
+        async with sem:
+            return await _fetch_recent_page(c, url, api_key, min(RECENT_BILLS_PAGE_SIZE, end - off), off)
+
+    pages = await asyncio.gather(*(one(o) for o in range(offset, end, RECENT_BILLS_PAGE_SIZE)))
+    return list(itertools.chain.from_iterable(pages))
 
 
 
@@ -129,39 +253,48 @@ async def fetch_bill_summaries(
     bill_number: str,
     api_key: str,
     base_url: str = DEFAULT_BASE,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> list[dict]:
-    """Fetch all summaries for a bill (CRS reports, etc)."""
+    """Fetch all summaries for a bill (CRS reports, etc).
+
+    A 404 means the bill has no summaries and yields []; any other failure raises.
+    """
     bill_type = bill_type.lower()
     url = f"{base_url.rstrip('/')}/bill/{congress}/{bill_type}/{bill_number}/summaries"
     params = {"format": "json", "api_key": api_key}
-    try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            r = await client.get(url, params=params)
-            # 404 means no summaries, which is fine
-            if r.status_code == 404:
-                return []
-            r.raise_for_status()
-            data = r.json()
-            return data.get("summaries", [])
-    except Exception:
+    if client is not None:
+        r = await client.get(url, params=params, timeout=10.0)
+    else:
+        async with httpx.AsyncClient(timeout=10.0) as c:
+            r = await c.get(url, params=params)
+    if r.status_code == 404:
         return []
+    r.raise_for_status()
+    data = msgspec.json.decode(r.content)
+    return data.get("summaries", [])
 
 
 async def fetch_random_bill(
     api_key: str,
     base_url: str = DEFAULT_BASE,
+    client: Optional[httpx.AsyncClient] = None,
 ) -> Bill:
     """Pick a random mature bill. ensuring it has content."""
-    import random
-    
-    choice = None
+    if client is not None:
+        return await _fetch_random_bill(api_key, base_url, client)
+    # One client for the whole workflow so every call reuses the same connections.
+    async with httpx.AsyncClient(http2=True, timeout=20.0) as c:
+        return await _fetch_random_bill(api_key, base_url, c)
+
+
+async def _fetch_random_bill(api_key: str, base_url: str, client: httpx.AsyncClient) -> Bill:
     bills = []
 
     # 1. Get a random "page" of bills to ensure matched maturity
     # Catch errors here in case offset is invalid or API is flaky
     try:
         offset = random.randint(50, 500)
-        bills = await fetch_recent_bills(api_key, limit=30, offset=offset, base_url=base_url)
+        bills = await fetch_recent_bills(api_key, limit=30, offset=offset, base_url=base_url, client=client)
     except Exception:
         # If offset fetch fails, swallow error and try no-offset below
         pass
@@ -169,7 +302,7 @@ async def fetch_random_bill(
     if not bills:
         # Fallback to recent if offset failed or empty
         try:
-            bills = await fetch_recent_bills(api_key, limit=30, base_url=base_url)
+            bills = await fetch_recent_bills(api_key, limit=30, base_url=base_url, client=client)
         except Exception:
              # Critical failure fallback
              blob = _text_blob("API Error", "Could not reach Congress.gov")
@@ -183,58 +316,58 @@ async def fetch_random_bill(
     substantive = [b for b in bills if b.get("type") in ["HR", "S"]]
     pool = substantive if substantive else bills
 
-    last_error_bill = None
-
-    # Retry loop: FAST check for summaries first
-    for _ in range(5):
-        try:
-            choice = random.choice(pool)
-        except IndexError:
-            break # Pool empty?
-
-        
-        congress = choice.get("congress")
-        bill_type = choice.get("type")
-        number = choice.get("number")
-        if not (congress and bill_type and number):
-            continue
-
-        # Fast Check: Does it have a summary?
-        # We hit the summaries endpoint FIRST. If empty, we skip this bill immediately.
-        # This prevents loading "empty" bills.
-        try:
-            summaries_list = await fetch_bill_summaries(
-                congress=congress,
-                bill_type=bill_type,
-                bill_number=str(number),
+    candidates = [
+        b for b in random.sample(pool, min(8, len(pool)))
+        if b.get("congress") and b.get("type") and b.get("number")
+    ]
+
+    # One request per candidate, all in flight at once: the bill payload already
+    # says whether summaries exist, so "empty" bills are skipped without a probe.
+    payloads = await asyncio.gather(
+        *[
+            fetch_bill(
+                congress=c.get("congress"),
+                bill_type=c.get("type"),
+                bill_number=str(c.get("number")),
                 api_key=api_key,
-                base_url=base_url
+                base_url=base_url,
+                client=client,
             )
-        except Exception:
+            for c in candidates
+        ],
+        return_exceptions=True,
+    )
+
+    for choice, payload in zip(candidates, payloads):
+        if not isinstance(payload, BillPayload):
             continue
-            
-        if not summaries_list:
+        summaries = payload.summaries
+        if summaries is None or not (summaries.count or summaries.summaries):
             # No summary? Skip it. User wants details.
             continue
-
-        # Found a summary! Now fetch the full details for the title/metadata
-        try:
-            raw_json = await fetch_bill_json(
-                congress=congress,
-                bill_type=bill_type,
-                bill_number=str(number),
-                api_key=api_key,
-                base_url=base_url
-            )
-        except Exception:
-            continue
+        texts = [x.text or "" for x in summaries.summaries]
+        if not texts:
+            # The payload only links to the summaries; fetch them for this bill alone.
+            try:
+                summaries_list = await fetch_bill_summaries(
+                    congress=choice.get("congress"),
+                    bill_type=choice.get("type"),
+                    bill_number=str(choice.get("number")),
+                    api_key=api_key,
+                    base_url=base_url,
+                    client=client,
+                )
+            except Exception:
+                summaries_list = []
+            texts = [x.get("text") or "" for x in summaries_list]
+            if not texts:
+                continue
 
         # Build the Object
-        bill = bill_json_to_bill_obj(raw_json)
+        bill = bill_payload_to_bill_obj(payload)
         
         # Inject the best summary
-        best = max(summaries_list, key=lambda x: len(x.get("text", "") or ""))
-        best_text = best.get("text", "").strip()
+        best_text = _longest_text(texts).strip()
         
         if len(best_text) > len(bill.summary):
             bill.summary = best_text
@@ -247,22 +380,76 @@ async def fetch_random_bill(
         return bill
 
     # If we fall through, just return a fallback from the pool (better than crashing or empty)
-    # We take the last choice and do best effort.
-    if choice:
-        try:
-             # Just fetch basic JSON if summaries failed
-             raw = await fetch_bill_json(congress=choice.get("congress"), bill_type=choice.get("type"), bill_number=str(choice.get("number")), api_key=api_key, base_url=base_url)
-             b_fallback = bill_json_to_bill_obj(raw)
-             # Fill text content with summary
-             b_fallback.text_content = b_fallback.summary
-             return b_fallback
-        except:
-             pass
+    # We take the last candidate's payload and do best effort.
+    if payloads and isinstance(payloads[-1], BillPayload):
+        b_fallback = bill_payload_to_bill_obj(payloads[-1])
+        # Fill text content with summary
+        b_fallback.text_content = b_fallback.summary
+        return b_fallback
             
     blob = _text_blob("Error Finding Bill", "Could not find a bill with detailed summaries.")
     return Bill(title="Simulation Error", summary="Please try again.", issue_vector=guess_issue_vector_from_text(blob))
 
 
+# (issue, delta, keywords): each rule adds its delta at most once per text,
+# when any of its keywords appears as a whole word.
+_ISSUE_KEYWORDS: Tuple[Tuple[Issue, float, Tuple[str, ...]], ...] = (
+    # climate
+    ("climate", 0.6, ("climate", "renewable", "emissions", "clean energy", "solar", "wind", "carbon")),
+    # economy (directional guess: spending/credits as '+'; deregulation/cuts as '-')
+    ("economy", 0.5, ("tax credit", "grant", "subsidy", "infrastructure", "investment", "job", "jobs", "minimum wage")),
+    ("economy", -0.4, ("tax cut", "deregulat", "reduce regulation", "privatiz")),
+    # healthcare
+    ("healthcare", 0.55, ("medicare", "medicaid", "healthcare", "hospital", "insurance", "prescription", "drug price")),
+    # immigration (directional guess: border/security '-')
+    ("immigration", 0.25, ("immigration", "asylum", "visa", "refugee", "citizenship")),
+    ("immigration", -0.55, ("border", "deport", "detention", "security wall", "e-verify")),
+    # education
+    ("education", 0.5, ("education", "school", "student loan", "pell grant", "teacher", "university", "college")),
+)
+
+_ISSUE_PATTERNS: Tuple[re.Pattern[str], ...] = tuple(
+    re.compile(r"\b(" + "|".join(map(re.escape, kws)) + r")\b") for _, _, kws in _ISSUE_KEYWORDS
+)
+
+
+def _build_keyword_automaton() -> Any:
+    # All keywords of all rules in one automaton: a single pass over the text finds every hit.
+    A = ahocorasick.Automaton()
+    for rule, (_, _, kws) in enumerate(_ISSUE_KEYWORDS):
+        for kw in kws:
+            A.add_word(kw, (rule, len(kw)))
+    A.make_automaton()
+    return A
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton() if ahocorasick is not None else None
+
+
+def _is_word_char(t: str, i: int) -> bool:
+    return 0 <= i < len(t) and (t[i].isalnum() or t[i] == "_")
+
+
+def _matched_rules(t: str) -> Set[int]:
+    """Indices into _ISSUE_KEYWORDS whose keywords occur in `t` (already lowercased)."""
+    if _KEYWORD_AUTOMATON is None:
+        return {rule for rule, pattern in enumerate(_ISSUE_PATTERNS) if pattern.search(t)}
+
+    hits: Set[int] = set()
+    for end, (rule, n) in _KEYWORD_AUTOMATON.iter(t):
+        # Same word-boundary rule as the regex path.
+        if rule in hits or _is_word_char(t, end - n) or _is_word_char(t, end + 1):
+            continue
+        hits.add(rule)
+        if len(hits) == len(_ISSUE_KEYWORDS):
+            break
+    return hits
+
+
+def _longest_text(texts: Iterable[str]) -> str:
+    return max(texts, key=len, default="")
+
+
 def _text_blob(*parts: Optional[str]) -> str:
     return "\n".join([p for p in parts if p])
 
@@ -273,8 +460,6 @@ def guess_issue_vector_from_text(text: str) -> Dict[Issue, float]:
     This is intentionally transparent and cheap. Replace later with a learned classifier
     or local LLM extraction if you want higher fidelity.
     """
-    t = text.lower()
-
     vec: Dict[Issue, float] = {
         "economy": 0.0,
         "climate": 0.0,
@@ -283,54 +468,31 @@ def guess_issue_vector_from_text(text: str) -> Dict[Issue, float]:
         "education": 0.0,
     }
 
-    # climate
-    if re.search(r"\b(climate|renewable|emissions|clean energy|solar|wind|carbon)\b", t):
-        vec["climate"] += 0.6
-
-    # economy (directional guess: spending/credits as '+'; deregulation/cuts as '-')
-    if re.search(r"\b(tax credit|grant|subsidy|infrastructure|investment|jobs?|minimum wage)\b", t):
-        vec["economy"] += 0.5
-    if re.search(r"\b(tax cut|deregulat|reduce regulation|privatiz)\b", t):
-        vec["economy"] -= 0.4
-
-    # healthcare
-    if re.search(r"\b(medicare|medicaid|healthcare|hospital|insurance|prescription|drug price)\b", t):
-        vec["healthcare"] += 0.55
-
-    # immigration (directional guess: border/security '-')
-    if re.search(r"\b(immigration|asylum|visa|refugee|citizenship)\b", t):
-        vec["immigration"] += 0.25
-    if re.search(r"\b(border|deport|detention|security wall|e-verify)\b", t):
-        vec["immigration"] -= 0.55
+    t = text.lower()
 
-    # education
-    if re.search(r"\b(education|school|student loan|pell grant|teacher|university|college)\b", t):
-        vec["education"] += 0.5
+    for rule in _matched_rules(t):
+        issue, delta, _ = _ISSUE_KEYWORDS[rule]
+        vec[issue] += delta
 
     # squash + normalize to [-1,1] per dimension
     vec = {k: _clamp(float(v)) for k, v in vec.items()}
     return vec
 
 
-def bill_json_to_bill_obj(data: Dict[str, Any]) -> Bill:
-    """Extract a minimal Bill object from the Congress.gov bill response."""
-    # The response structure includes a top-level 'bill' element in the v3 API.
-    bill = data.get("bill") or data
-    title = bill.get("title") or bill.get("shortTitle") or bill.get("number") or "Untitled Bill"
+def bill_payload_to_bill_obj(bill: BillPayload) -> Bill:
+    """Build a Bill from an already-decoded BillPayload."""
+    title = bill.title or bill.shortTitle or bill.number or "Untitled Bill"
 
     # Best-effort summary extraction. Not all bills have summaries.
     # We prioritize the longest summary (usually CRS detailed report) over short 'Introduced' blurbs.
     summary = ""
-    if isinstance(bill.get("summaries"), dict):
-        s_list = bill["summaries"].get("summaries", [])
-        if isinstance(s_list, list) and s_list:
-            # Find the summary with the longest text content
-            best_summary = max(s_list, key=lambda x: len(x.get("text", "") or ""))
-            summary = best_summary.get("text", "")
+    if bill.summaries is not None:
+        # Find the summary with the longest text content
+        summary = _longest_text(s.text or "" for s in bill.summaries.summaries)
 
     # Fallback to latest action if absolutely no summary found
     if not summary or len(summary) < 50:
-        latest_text = bill.get("latestAction", {}).get("text")
+        latest_text = bill.latestAction.text if bill.latestAction is not None else None
         if latest_text:
             if summary:
                  summary = summary + "\n\nLatest Action: " + latest_text
@@ -339,7 +501,7 @@ def bill_json_to_bill_obj(data: Dict[str, Any]) -> Bill:
     
     summary = summary or "(No summary available from API response.)"
 
-    blob = _text_blob(title, summary)
+    blob = _text_blob(str(title), summary)
     issue_vector = guess_issue_vector_from_text(blob)
     
     # We return the Bill object. 
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import csv
 import io
 from dataclasses import replace
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, List, Union
+
+import polars as pl
 
 from ..sim.agent import District
 
@@ -12,8 +13,14 @@ def _clamp(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
     return max(lo, min(hi, x))
 
 
+def _votes(col: str) -> pl.Expr:
+    # "12,345" -> 12345.0; blank counts as 0, anything unparseable becomes null.
+    v = pl.col(col).str.replace_all(",", "", literal=True).str.strip_chars()
+    return pl.when(v == "").then(pl.lit("0")).otherwise(v).cast(pl.Float64, strict=False)
+
+
 def parse_house_csv_two_party(
-    csv_text: str,
+    csv_data: Union[bytes, io.BytesIO],
     *,
     state_fips_col: str,
     cd_col: str,
@@ -24,35 +31,52 @@ def parse_house_csv_two_party(
     """Return mapping {"<state_fips>-<cd>": lean} where lean in [-1,1].
 
     lean = 2*(dem_share - 0.5), so +1 is 100% Dem, -1 is 100% Rep.
+    `csv_data` may be a BytesIO the download was streamed into; it is read without copying.
     """
-    f = io.StringIO(csv_text)
-    reader = csv.DictReader(f, delimiter=delimiter)
-    out: Dict[str, float] = {}
-    for row in reader:
-        s = (row.get(state_fips_col) or "").strip()
-        cd = (row.get(cd_col) or "").strip()
-        if not s or not cd:
-            continue
+    buf = csv_data if isinstance(csv_data, io.BytesIO) else io.BytesIO(csv_data)
+    raw = buf.getvalue()
+    if not raw or raw.isspace():
+        return {}
+    buf.seek(0)
 
-        try:
-            dem = float((row.get(dem_votes_col) or "0").replace(",", ""))
-            rep = float((row.get(rep_votes_col) or "0").replace(",", ""))
-        except Exception:
-            continue
+    df = pl.read_csv(
+        buf,
+        separator=delimiter,
+        columns=[state_fips_col, cd_col, dem_votes_col, rep_votes_col],
+        infer_schema=False,
+        # Like csv.DictReader: extra fields are dropped, missing ones read as empty.
+        truncate_ragged_lines=True,
+        encoding="utf8-lossy",
+    ).fill_null("")
 
-        denom = dem + rep
-        if denom <= 0:
-            continue
-        dem_share = dem / denom
-        lean = _clamp(2.0 * (dem_share - 0.5))
+    s = pl.col(state_fips_col).str.strip_chars()
+    cd = pl.col(cd_col).str.strip_chars()
+    # Normalize CD code (strip leading zeros except keep 'AL' if present)
+    cd_norm = (
+        pl.when(cd.str.contains(r"^\d+$"))
+        .then(cd.str.strip_chars_start("0").replace("", "0"))
+        .otherwise(cd)
+    )
+    denom = pl.col("dem") + pl.col("rep")
 
-        # Normalize CD code (strip leading zeros except keep 'AL' if present)
-        cd_norm = cd
-        if cd_norm.isdigit():
-            cd_norm = str(int(cd_norm))
-        key = f"{s.zfill(2)}-{cd_norm}"
-        out[key] = lean
-    return out
+    out = (
+        df.lazy()
+        .select(s.alias("s"), cd.alias("cd"), cd_norm.alias("cd_norm"),
+                _votes(dem_votes_col).alias("dem"), _votes(rep_votes_col).alias("rep"))
+        .filter(
+            (pl.col("s") != "") & (pl.col("cd") != "")
+            # "nan"/"inf" parse as floats but are not vote counts.
+            & pl.col("dem").is_finite() & pl.col("rep").is_finite()
+            & (denom > 0)
+        )
+        .select(
+            (pl.col("s").str.zfill(2) + "-" + pl.col("cd_norm")).alias("key"),
+            (2.0 * pl.col("dem") / denom - 1.0).clip(-1.0, 1.0).alias("lean"),
+        )
+        .collect()
+    )
+    # Later rows win on duplicate keys, as with a plain dict build.
+    return dict(out.iter_rows())
 
 
 def apply_lean(districts: List[District], lean_map: Dict[str, float], strength: float = 1.0) -> List[District]:
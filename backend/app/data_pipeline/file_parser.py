@@ -1,14 +1,76 @@
-from typing import Tuple
-import io
-from pypdf import PdfReader
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar, Union
+import asyncio
+import os
 
-def parse_bill_file_content(filename: str, content: bytes) -> Tuple[str, str]:
+T = TypeVar("T")
+
+# Parsing is CPU-bound; a small dedicated pool keeps a burst of large uploads from
+# occupying the loop's default executor, which other to_thread work shares.
+PARSE_MAX_WORKERS = min(4, os.cpu_count() or 1)
+
+_parse_pool: Optional[ThreadPoolExecutor] = None
+
+
+def _get_parse_pool() -> ThreadPoolExecutor:
+    global _parse_pool
+    if _parse_pool is None:
+        _parse_pool = ThreadPoolExecutor(max_workers=PARSE_MAX_WORKERS, thread_name_prefix="parse")
+    return _parse_pool
+
+
+async def run_parser(fn: Callable[..., T], *args: Any) -> T:
+    """Run a blocking parser on the parse pool without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(_get_parse_pool(), fn, *args)
+
+
+def shutdown() -> None:
+    """Stop the parse pool's threads (call on app teardown)."""
+    global _parse_pool
+    if _parse_pool is not None:
+        _parse_pool.shutdown(wait=False, cancel_futures=True)
+        _parse_pool = None
+
+
+def html_to_text(raw: Union[str, bytes], separator: str = "\n") -> str:
+    """Strip tags from an HTML/XML document, dropping script/style bodies."""
+    # Imported lazily: processes that only ever see plain text skip the cost.
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(raw)
+    for node in tree.css("script, style"):
+        node.decompose()
+    return tree.root.text(separator=separator) if tree.root is not None else ""
+
+
+def extract_pdf_text(content: bytes) -> str:
+    """Extract text page by page with PDFium (C, releases the GIL)."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(content)
+    try:
+        parts = []
+        for page in pdf:
+            extracted = page.get_textpage().get_text_range()
+            if extracted:
+                # PDFium reports line breaks as CRLF.
+                parts.append(extracted.replace("\r\n", "\n"))
+        return "\n\n".join(parts)
+    finally:
+        pdf.close()
+
+
+async def parse_bill_file_content(filename: str, content: bytes) -> Tuple[str, str]:
+    """Non-blocking wrapper: parsing runs on the parse pool."""
+    return await run_parser(_parse_bill_file_sync, filename, content)
+
+
+def _parse_bill_file_sync(filename: str, content: bytes) -> Tuple[str, str]:
     """
     Parses uploaded file content and returns (title_guess, text_content).
     Methods:
       - PDF: Extract text page by page.
-      - XML/HTML: Use BS4 to strip tags.
+      - XML/HTML: Use selectolax (lexbor) to strip tags.
       - TXT: Decode utf-8.
     """
     fname = filename.lower()
@@ -16,31 +78,15 @@ def parse_bill_file_content(filename: str, content: bytes) -> Tuple[str, str]:
     
     if fname.endswith(".pdf"):
         try:
-            reader = PdfReader(io.BytesIO(content))
-            parts = []
-            for page in reader.pages:
-                extracted = page.extract_text()
-                if extracted:
-                    parts.append(extracted)
-            text = "\n\n".join(parts)
+            text = extract_pdf_text(content)
         except Exception as e:
             text = f"Error reading PDF: {str(e)}"
             
     elif fname.endswith(".html") or fname.endswith(".htm") or fname.endswith(".xml"):
         try:
-            # XML in Congress.gov often resembles HTML or has specific tags. 
-            # BS4 'lxml' or 'xml' parser is good. We'll try generic html.parser or lxml if available.
-            # Using 'html.parser' to avoid lxml dependency if not installed (though bs4 usually needs it for xml).
-            # We'll stick to 'html.parser' for safety or just 'lxml-xml' if we strictly want xml, 
-            # but usually 'features="xml"' provided by bs4 works.
-            
-            soup = BeautifulSoup(content, features="html.parser")
-            
-            # Remove scripts and styles
-            for script in soup(["script", "style"]):
-                script.decompose()
-                
-            text = soup.get_text(separator="\n")
+            # XML in Congress.gov often resembles HTML; the lexbor HTML parser
+            # handles both well enough for plain-text extraction.
+            text = html_to_text(content, separator="\n")
         except Exception as e:
             text = f"Error parsing HTML/XML: {str(e)}"
             
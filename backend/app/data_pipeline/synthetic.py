@@ -1,13 +1,10 @@
 from __future__ import annotations
 
 from typing import Dict, List, Optional
-import random
 
-from ..sim.agent import District, Issue
+import numpy as np
 
-
-def _clamp(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
-    return max(lo, min(hi, x))
+from ..sim.agent import ISSUE_ORDER, District, Issue
 
 
 def split_districts(
@@ -26,28 +23,43 @@ def split_districts(
     if multiplier <= 1:
         return list(base)
 
-    rng = random.Random(seed)
-    out: List[District] = []
+    rng = np.random.default_rng(seed)
+    n = len(base) * multiplier
+    if n == 0:
+        return []
+
+    # All noise is drawn up front; row j is sub-district j % multiplier of base[j // multiplier].
+    base_lean = np.array([d.lean for d in base], dtype=np.float64)
+    base_w = np.array([[float(d.weights.get(k, 0.0)) for k in ISSUE_ORDER] for d in base], dtype=np.float64)
+    present = np.repeat(np.array([[k in d.weights for k in ISSUE_ORDER] for d in base]), multiplier, axis=0)
+
+    # Jitter lean a bit to create intra-district diversity.
+    lean = np.clip(np.repeat(base_lean, multiplier) + rng.standard_normal(n) * (jitter * 0.35), -1.0, 1.0)
 
+    # Jitter issue weights then renormalize (issues a base district lacks stay absent).
+    W = np.maximum(0.01, np.repeat(base_w, multiplier, axis=0) + rng.standard_normal((n, len(ISSUE_ORDER))) * (jitter * 0.08))
+    W = np.where(present, W, 0.0)
+    s = W.sum(axis=1, keepdims=True)
+    W /= np.where(s > 0, s, 1.0)
+
+    income_scale = 1 + rng.standard_normal(n) * (jitter * 0.05)
+    poverty_shift = rng.standard_normal(n) * (jitter * 0.02)
+
+    leans, rows, income_scales, poverty_shifts = lean.tolist(), W.tolist(), income_scale.tolist(), poverty_shift.tolist()
+    keep = present.tolist()
+    out: List[District] = []
+    j = 0
     for d in base:
         sub_pop = max(1, int(d.population / multiplier)) if d.population else 0
         for i in range(multiplier):
-            # Jitter lean a bit to create intra-district diversity.
-            lean = _clamp(d.lean + rng.gauss(0.0, jitter * 0.35))
-
-            # Jitter issue weights then renormalize.
-            w: Dict[Issue, float] = {}
-            for iss, val in d.weights.items():
-                w[iss] = max(0.01, float(val) + rng.gauss(0.0, jitter * 0.08))
-            s = sum(w.values()) or 1.0
-            w = {k: v / s for k, v in w.items()}
+            w: Dict[Issue, float] = {k: v for k, v, has in zip(ISSUE_ORDER, rows[j], keep[j]) if has}
 
             # Demographics: keep close to base.
             demo = dict(d.demographics)
             if "median_income" in demo and demo["median_income"]:
-                demo["median_income"] = max(0.0, float(demo["median_income"]) * (1 + rng.gauss(0.0, jitter * 0.05)))
+                demo["median_income"] = max(0.0, float(demo["median_income"]) * income_scales[j])
             if "poverty_rate" in demo:
-                demo["poverty_rate"] = max(0.0, min(1.0, float(demo["poverty_rate"]) + rng.gauss(0.0, jitter * 0.02)))
+                demo["poverty_rate"] = max(0.0, min(1.0, float(demo["poverty_rate"]) + poverty_shifts[j]))
 
             out.append(
                 District(
@@ -55,11 +67,12 @@ def split_districts(
                     name=f"{d.name} (sub {i+1})",
                     state_fips=d.state_fips,
                     cd=d.cd,
-                    lean=lean,
+                    lean=leans[j],
                     population=sub_pop,
                     demographics=demo,
                     weights=w,
                 )
             )
+            j += 1
 
     return out
@@ -1,12 +1,17 @@
 from __future__ import annotations
+import asyncio
+import io
 import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 import httpx
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from . import cache
 from .models import (
     SimRequest,
     SimResponse,
@@ -19,21 +24,26 @@ from .models import (
 )
 from .state import (
     get_active_districts,
+    get_active_snapshot,
     get_active_summary,
+    get_active_summary_bytes,
     set_active_districts,
     load_mock_districts,
+    ensure_loaded,
 )
 from .sim.engine import run_simulation
 from .data_pipeline.census_acs import fetch_acs5_congressional_districts, acs_rows_to_districts
 from .data_pipeline.synthetic import split_districts
 from .data_pipeline.congressgov import (
-    fetch_bill_json, 
-    bill_json_to_bill_obj, 
+    fetch_bill,
+    fetch_bill_json,
+    bill_payload_to_bill_obj,
     fetch_random_bill,
     fetch_recent_bills,
-    fetch_bill_summaries
+    fetch_bill_summaries,
 )
 from .data_pipeline.elections import parse_house_csv_two_party, apply_lean
+from .data_pipeline import file_parser
 
 APP_ORIGIN = os.getenv("APP_ORIGIN", "http://localhost:5173")
 
@@ -45,7 +55,29 @@ ORIGINS = [
     "http://localhost:8000",
 ]
 
-app = FastAPI(title="Congress Simulation MVP", version="0.1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One pooled HTTP/2 client for every outbound call (Ollama, Congress.gov, Census, CSV downloads).
+    app.state.http = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+    # Load the default districts and connect the cache concurrently.
+    await asyncio.gather(asyncio.to_thread(ensure_loaded), cache.warmup())
+    yield
+    await app.state.http.aclose()
+    await cache.shutdown()
+    file_parser.shutdown()
+
+
+app = FastAPI(
+    title="Congress Simulation MVP",
+    version="0.1.0",
+    lifespan=lifespan,
+    # orjson encodes the large /simulate and district payloads far faster than stdlib json.
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -62,7 +94,8 @@ def health():
 
 @app.get("/districts/summary", response_model=DistrictSummary)
 def districts_summary():
-    return get_active_summary()
+    # Pre-encoded and cached until the active districts change; skips re-validation.
+    return Response(content=get_active_summary_bytes(), media_type="application/json")
 
 
 @app.post("/districts/use_mock", response_model=DistrictSummary)
@@ -78,6 +111,7 @@ async def districts_load_acs(req: LoadAcsRequest):
             year=req.year,
             state_fips=req.state_fips,
             variables=req.variables,
+            client=app.state.http,
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to fetch ACS data: {e}")
@@ -131,17 +165,19 @@ async def elections_load_csv_url(req: LoadElectionCsvUrlRequest):
     if not base:
         raise HTTPException(status_code=400, detail="No active districts loaded.")
 
+    # Stream into one buffer rather than holding the response body and a decoded copy.
+    csv_buf = io.BytesIO()
     try:
-        async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-            resp = await client.get(req.url)
+        async with app.state.http.stream("GET", req.url, follow_redirects=True) as resp:
             resp.raise_for_status()
-            csv_text = resp.text
+            async for chunk in resp.aiter_bytes():
+                csv_buf.write(chunk)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to download CSV: {e}")
 
     try:
         lean_map = parse_house_csv_two_party(
-            csv_text,
+            csv_buf,
             state_fips_col=req.state_fips_col,
             cd_col=req.cd_col,
             dem_votes_col=req.dem_votes_col,
@@ -180,16 +216,19 @@ async def ingest_bill(req: CongressGovIngestRequest):
 
     base = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
     try:
-        raw = await fetch_bill_json(
+        payload = await fetch_bill(
             congress=req.congress,
             bill_type=req.bill_type,
             bill_number=req.bill_number,
             api_key=api_key,
             base_url=base,
+            client=app.state.http,
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Congress.gov API error: {e}")
-    return bill_json_to_bill_obj(raw)
+    if payload is None:
+        raise HTTPException(status_code=400, detail="Congress.gov API error: response has no bill.")
+    return bill_payload_to_bill_obj(payload)
 
 @app.get("/bills/random", response_model=Bill)
 async def get_random_bill():
@@ -202,14 +241,18 @@ async def get_random_bill():
     
     base = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
     try:
-        return await fetch_random_bill(api_key=api_key, base_url=base)
+        return await fetch_random_bill(api_key=api_key, base_url=base, client=app.state.http)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to fetch random bill: {e}")
     
 
 
 @app.get("/congress/recent")
-async def get_recent_bills(limit: int = 20, offset: int = 0):
+async def get_recent_bills(
+    # At most four upstream pages per call; the route is unauthenticated and shares one API key.
+    limit: int = Query(20, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+):
     api_key = os.getenv("CONGRESS_GOV_API_KEY") or os.getenv("CONGRESS_API_KEY")
     if not api_key:
         raise HTTPException(
@@ -218,10 +261,18 @@ async def get_recent_bills(limit: int = 20, offset: int = 0):
         )
     
     base = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
+    key = f"cg:recent:{limit}:{offset}"
+    cached = await cache.get_json(key)
+    if cached is not None:
+        return cached
     try:
-        return await fetch_recent_bills(api_key=api_key, limit=limit, offset=offset, base_url=base)
+        bills = await fetch_recent_bills(
+            api_key=api_key, limit=limit, offset=offset, base_url=base, client=app.state.http
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Congress API error: {str(e)}")
+    await cache.set_json(key, bills, ttl=3600)
+    return bills
 
 
 @app.get("/congress/bill/{congress}/{bill_type}/{bill_number}")
@@ -231,16 +282,23 @@ async def get_bill_detail(congress: int, bill_type: str, bill_number: str):
         raise HTTPException(status_code=500, detail="Server missing API Key")
         
     base = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
+    key = f"cg:bill:{congress}:{bill_type.lower()}:{bill_number}"
+    cached = await cache.get_json(key)
+    if cached is not None:
+        return cached
     try:
-        return await fetch_bill_json(
+        data = await fetch_bill_json(
             congress=congress,
             bill_type=bill_type,
             bill_number=bill_number,
             api_key=api_key,
-            base_url=base
+            base_url=base,
+            client=app.state.http,
         )
     except Exception as e:
         raise HTTPException(status_code=404, detail=f"Bill not found or API error: {str(e)}")
+    await cache.set_json(key, data, ttl=86400)
+    return data
 
 
 @app.get("/congress/bill/{congress}/{bill_type}/{bill_number}/summaries")
@@ -250,16 +308,24 @@ async def get_bill_summaries(congress: int, bill_type: str, bill_number: str):
         raise HTTPException(status_code=500, detail="Server missing API Key")
         
     base = os.getenv("CONGRESS_API_BASE", "https://api.congress.gov/v3")
+    key = f"cg:sum:{congress}:{bill_type.lower()}:{bill_number}"
+    cached = await cache.get_json(key)
+    if cached is not None:
+        return {"summaries": cached}
     try:
-        return {"summaries": await fetch_bill_summaries(
+        summaries = await fetch_bill_summaries(
             congress=congress,
             bill_type=bill_type,
             bill_number=bill_number,
             api_key=api_key,
-            base_url=base
-        )}
+            base_url=base,
+            client=app.state.http,
+        )
     except Exception as e:
+        # Upstream failure (not a 404): answer empty, but don't cache it.
         return {"summaries": []}
+    await cache.set_json(key, summaries, ttl=86400)
+    return {"summaries": summaries}
 
 
 
@@ -271,7 +337,7 @@ async def upload_bill_file(file: UploadFile = File(...)):
     """Parse an uploaded file (PDF, TXT, HTML, XML) into a Bill object."""
     try:
         content = await file.read()
-        title_guess, text = parse_bill_file_content(file.filename or "uploaded_bill", content)
+        title_guess, text = await parse_bill_file_content(file.filename or "uploaded_bill", content)
         
         # Simple heuristic summary: first 500 chars
         summary_guess = text[:500] + "..." if len(text) > 500 else text
@@ -292,15 +358,17 @@ async def upload_bill_file(file: UploadFile = File(...)):
 
 @app.post("/simulate", response_model=SimResponse)
 async def simulate(req: SimRequest):
-    districts = get_active_districts()
+    districts, arrays = get_active_snapshot()
     out = await run_simulation(
         districts=districts,
+        arrays=arrays,
         num_members=req.num_members,
         rounds=req.rounds,
         issue_vector=req.bill.issue_vector,
         use_llm=req.use_llm,
         llm_model=req.llm_model,
         seed=req.seed,
+        client=app.state.http,
     )
 
     notes = []
@@ -310,10 +378,13 @@ async def simulate(req: SimRequest):
         notes.append("Debate text: template fallback (no AI calls).")
     notes.append("Votes: deterministic utility model (transparent).")
 
-    return SimResponse(
-        members=out["members"],
-        bill=req.bill,
-        rounds=out["rounds"],
-        final_passed=out["final_passed"],
-        notes=notes,
-    )
+    # The engine builds this payload itself, so hand it straight to orjson.
+    # Returning a Response skips FastAPI's response_model validation and
+    # serialization pass; the model still documents the schema.
+    return ORJSONResponse(content={
+        "members": out["members"],
+        "bill": req.bill.model_dump(),
+        "rounds": out["rounds"],
+        "final_passed": out["final_passed"],
+        "notes": notes,
+    })
@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 from typing import Any, Dict, List, Optional, Literal
 
-Issue = Literal["economy","climate","healthcare","immigration","education"]
+from .sim.issues import Issue
 
 class Bill(BaseModel):
     title: str = Field(..., examples=["Clean Energy Incentives Act"])
@@ -1,9 +1,11 @@
 from dataclasses import dataclass, field
-from typing import Dict, Literal, Optional
+from typing import Dict, List, Optional, Tuple
 
-Issue = Literal["economy","climate","healthcare","immigration","education"]
+import numpy as np
 
-@dataclass(frozen=True)
+from .issues import ISSUE_ORDER, Issue, issue_vec
+
+@dataclass(frozen=True, slots=True)
 class District:
     district_id: str
     name: str
@@ -13,8 +15,35 @@ class District:
     population: int = 0
     demographics: Dict[str, float] = field(default_factory=dict)
     weights: Dict[Issue, float] = field(default_factory=dict)  # issue salience in the district
+    # `weights` in ISSUE_ORDER (0.0 where absent); derived, so never passed in.
+    weights_vec: Tuple[float, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "weights_vec", issue_vec(self.weights))
+
+@dataclass(frozen=True)
+class DistrictArrays:
+    """Struct-of-arrays view of a district list; row i is districts[i]."""
+    weights: np.ndarray      # (D, len(ISSUE_ORDER)) issue salience, 0 where a district lacks an issue
+    lean: np.ndarray         # (D,)
+    population: np.ndarray   # (D,)
+    cdf: np.ndarray          # (D,) cumulative population share, for searchsorted sampling
+
+def district_arrays(districts: List[District]) -> DistrictArrays:
+    population = np.array([int(d.population) for d in districts], dtype=np.int64)
+    # Weight by population to approximate representational density.
+    cdf = np.cumsum(np.maximum(1, population).astype(np.float64))
+    if len(cdf):
+        cdf /= cdf[-1]
+    return DistrictArrays(
+        weights=np.array([d.weights_vec for d in districts],
+                         dtype=np.float64).reshape(len(districts), len(ISSUE_ORDER)),
+        lean=np.array([float(d.lean) for d in districts], dtype=np.float64),
+        population=population,
+        cdf=cdf,
+    )
 
-@dataclass
+@dataclass(slots=True)
 class Member:
     member_id: str
     district: District
@@ -22,10 +51,13 @@ class Member:
     party_hint: str             # purely cosmetic for UI (not used in voting)
 
     def utility_by_issue(self, issue_vector: Dict[Issue, float]) -> Dict[str, float]:
-        contrib: Dict[str, float] = {}
-        for issue, v in issue_vector.items():
-            w = float(self.district.weights.get(issue, 0.0))
-            contrib[issue] = w * v * float(self.ideology)
+        iv_vec = issue_vec(issue_vector)
+        ideology = float(self.ideology)
+        contrib: Dict[str, float] = {
+            issue: w * v * ideology
+            for issue, w, v in zip(ISSUE_ORDER, self.district.weights_vec, iv_vec)
+            if issue in issue_vector
+        }
         # district lean bias: members track district lean somewhat
         contrib["district_lean_bias"] = 0.25 * float(self.district.lean) * float(self.ideology)
         return contrib
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Dict, List, Literal, Optional
+import functools
+from typing import Dict, List, Literal, Optional, Tuple
 import httpx
 
 from .agent import Member, Issue
@@ -9,14 +10,20 @@ Stance = Literal["support","oppose","amend"]
 def template_speech(member: Member, stance: Stance, issue_vector: Dict[Issue, float]) -> str:
     # Keep it short and structured. Avoid pretending to be a real person.
     top = sorted(member.district.weights.items(), key=lambda kv: kv[1], reverse=True)[:2]
-    top_issues = [k for k,_ in top]
-    lean_word = "left-leaning" if member.district.lean > 0.15 else "right-leaning" if member.district.lean < -0.15 else "mixed"
-    dir_words = []
-    for iss in top_issues:
-        v = issue_vector.get(iss, 0.0)
-        if abs(v) < 0.15:
-            continue
-        dir_words.append(f"{iss} {'expands' if v>0 else 'restricts'} policy")
+    lean = member.district.lean
+    lean_bucket = 1 if lean > 0.15 else -1 if lean < -0.15 else 0
+    # Only the direction of each top issue reaches the text, so the key stays small.
+    dirs = tuple(
+        (iss, v > 0)
+        for iss, v in ((k, issue_vector.get(k, 0.0)) for k, _ in top)
+        if abs(v) >= 0.15
+    )
+    return _template_speech_cached(stance, lean_bucket, dirs)
+
+@functools.lru_cache(maxsize=4096)
+def _template_speech_cached(stance: Stance, lean_bucket: int, dirs: Tuple[Tuple[str, bool], ...]) -> str:
+    lean_word = "left-leaning" if lean_bucket > 0 else "right-leaning" if lean_bucket < 0 else "mixed"
+    dir_words = [f"{iss} {'expands' if up else 'restricts'} policy" for iss, up in dirs]
     dir_clause = ", ".join(dir_words) if dir_words else "the bill is mixed across issues"
     if stance == "support":
         return (f"I support this bill. My district is {lean_word}, and {dir_clause}. "
@@ -27,17 +34,21 @@ def template_speech(member: Member, stance: Stance, issue_vector: Dict[Issue, fl
     return (f"I want amendments. My district is {lean_word}; we should keep the benefits but reduce the downsides. "
             f"Let's adjust the bill to better match the median voter in the district.")
 
-async def ollama_generate(prompt: str, model: str, base_url: str = "http://localhost:11434") -> Optional[str]:
+async def ollama_generate(prompt: str, model: str, base_url: str = "http://localhost:11434", *,
+                          client: Optional[httpx.AsyncClient] = None) -> Optional[str]:
     # Ollama generate endpoint: POST /api/generate
+    # Pass the app's shared client to keep connections alive across speeches.
+    url = f"{base_url}/api/generate"
+    payload = {"model": model, "prompt": prompt, "stream": False}
     try:
-        async with httpx.AsyncClient(timeout=20) as client:
-            r = await client.post(
-                f"{base_url}/api/generate",
-                json={"model": model, "prompt": prompt, "stream": False},
-            )
-            r.raise_for_status()
-            data = r.json()
-            return data.get("response")
+        if client is not None:
+            r = await client.post(url, json=payload, timeout=20)
+        else:
+            async with httpx.AsyncClient(timeout=20) as c:
+                r = await c.post(url, json=payload)
+        r.raise_for_status()
+        data = r.json()
+        return data.get("response")
     except Exception:
         return None
 
@@ -58,10 +69,11 @@ def build_prompt(member: Member, stance: Stance, issue_vector: Dict[Issue, float
     )
 
 async def generate_speech(member: Member, stance: Stance, issue_vector: Dict[Issue, float],
-                          use_llm: bool, llm_model: str) -> str:
+                          use_llm: bool, llm_model: str,
+                          client: Optional[httpx.AsyncClient] = None) -> str:
     if not use_llm:
         return template_speech(member, stance, issue_vector)
 
     prompt = build_prompt(member, stance, issue_vector)
-    out = await ollama_generate(prompt, model=llm_model)
+    out = await ollama_generate(prompt, model=llm_model, client=client)
     return out.strip() if out else template_speech(member, stance, issue_vector)
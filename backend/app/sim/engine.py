@@ -1,75 +1,110 @@
 from __future__ import annotations
-import random, math
-from typing import Dict, List, Tuple
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from .agent import District, Member, Issue
+import httpx
+import numpy as np
+
+from .agent import District, DistrictArrays, Member, district_arrays
+from .issues import ISSUE_ORDER, Issue, issue_array, issue_dict
 from .debate import generate_speech
 
-def sample_members(districts: List[District], n: int, rng: random.Random) -> List[Member]:
-    # Weight by population to approximate representational density.
-    pops = [max(1, d.population) for d in districts]
-    total = float(sum(pops))
-    probs = [p/total for p in pops]
-
-    members: List[Member] = []
-    for i in range(n):
-        d = rng.choices(districts, weights=probs, k=1)[0]
-        # ideology roughly tracks district lean but with noise
-        ideology = max(-1.0, min(1.0, rng.gauss(mu=d.lean, sigma=0.35)))
-        party_hint = "Blue" if ideology > 0.15 else "Red" if ideology < -0.15 else "Purple"
-        members.append(Member(member_id=f"M-{i+1:04d}", district=d, ideology=ideology, party_hint=party_hint))
-    return members
-
-def pick_spokespeople(members: List[Member], k: int = 7) -> List[Member]:
+# Ollama runs only a few generations at a time; extra requests wait on its side,
+# where the wait counts against their timeout. Keep the rest queued here instead.
+LLM_MAX_CONCURRENCY = int(os.getenv("OLLAMA_MAX_CONCURRENCY", "2"))
+
+@dataclass
+class MemberPool:
+    """Struct-of-arrays chamber: member i sits for districts[district_idx[i]]."""
+    district_idx: np.ndarray  # (N,) int
+    ideology: np.ndarray      # (N,) -1..+1 (right..left)
+    lean: np.ndarray          # (N,) district lean per member
+    weights: np.ndarray       # (N, len(ISSUE_ORDER)) district issue salience per member
+    party_hint: np.ndarray    # (N,) purely cosmetic for UI (not used in voting)
+
+    def __len__(self) -> int:
+        return int(self.ideology.shape[0])
+
+    def member(self, i: int, districts: List[District]) -> Member:
+        """Materialize member i as a Member (used for the debate path)."""
+        return Member(
+            member_id=f"M-{i+1:04d}",
+            district=districts[int(self.district_idx[i])],
+            ideology=float(self.ideology[i]),
+            party_hint=str(self.party_hint[i]),
+        )
+
+def sample_members(districts: List[District], n: int, rng: np.random.Generator,
+                   arrays: Optional[DistrictArrays] = None) -> MemberPool:
+    arrays = arrays if arrays is not None else district_arrays(districts)
+    # Population-weighted draw from the precomputed CDF (what rng.choice(p=...) does internally).
+    idx = np.searchsorted(arrays.cdf, rng.random(n), side="right")
+    lean = arrays.lean[idx]
+    # ideology roughly tracks district lean but with noise
+    ideology = np.clip(rng.normal(loc=lean, scale=0.35, size=n), -1.0, 1.0)
+    return MemberPool(
+        district_idx=idx,
+        ideology=ideology,
+        lean=lean,
+        weights=arrays.weights[idx],
+        party_hint=np.where(ideology > 0.15, "Blue", np.where(ideology < -0.15, "Red", "Purple")),
+    )
+
+def pick_spokespeople(pool: MemberPool, rng: np.random.Generator, k: int = 7) -> List[int]:
+    """Pool indices of the debate speakers."""
     # Choose a small set for debate to keep compute reasonable.
-    sorted_m = sorted(members, key=lambda m: m.ideology)
-    if len(sorted_m) <= k:
-        return sorted_m
-    idxs = [0, len(sorted_m)//4, len(sorted_m)//2, 3*len(sorted_m)//4, len(sorted_m)-1]
-    # Keep uniqueness by member_id (Member is not hashable).
-    chosen: List[Member] = []
+    n = len(pool)
+    if n <= k:
+        return np.argsort(pool.ideology, kind="stable").tolist()
+    idxs = [0, n//4, n//2, 3*n//4, n-1]
+    # O(N) selection: each kth slot holds its sorted-order member, and the
+    # slots in between hold exactly the members ranked between them.
+    order = np.argpartition(pool.ideology, idxs).tolist()
+    chosen: List[int] = []
     seen = set()
     for i in idxs:
-        m = sorted_m[i]
-        if m.member_id not in seen:
+        m = order[i]
+        if m not in seen:
             chosen.append(m)
-            seen.add(m.member_id)
+            seen.add(m)
 
-    mid = sorted_m[len(sorted_m)//4 : 3*len(sorted_m)//4]
+    mid = order[n//4 : 3*n//4]
     while len(chosen) < k and mid:
-        m = random.choice(mid)
-        if m.member_id not in seen:
+        m = mid[rng.integers(len(mid))]
+        if m not in seen:
             chosen.append(m)
-            seen.add(m.member_id)
+            seen.add(m)
     return chosen
 
-def vote(members: List[Member], issue_vector: Dict[Issue, float], threshold: float = 0.5) -> Tuple[int,int,int,bool]:
-    yes=no=abstain=0
-    for m in members:
-        u = m.utility(issue_vector)
-        # abstain if near-indifferent
-        if abs(u) < 0.03:
-            abstain += 1
-        elif u > 0:
-            yes += 1
-        else:
-            no += 1
+def rationale(pool: MemberPool, i: int, iv_arr: np.ndarray, issues: Iterable[str]) -> Dict[str, float]:
+    """Member i's utility contributions (same terms as Member.utility_by_issue)."""
+    ideology = float(pool.ideology[i])
+    contrib = (pool.weights[i] * iv_arr * ideology).tolist()
+    out: Dict[str, float] = {k: contrib[j] for j, k in enumerate(ISSUE_ORDER) if k in issues}
+    # district lean bias: members track district lean somewhat
+    out["district_lean_bias"] = 0.25 * float(pool.lean[i]) * ideology
+    return out
+
+def vote(pool: MemberPool, iv_arr: np.ndarray, threshold: float = 0.5) -> Tuple[int,int,int,bool]:
+    # Same utility as Member.utility, for every member at once.
+    u = (pool.weights @ iv_arr) * pool.ideology + 0.25 * pool.lean * pool.ideology
+    # abstain if near-indifferent
+    abstain = int(np.count_nonzero(np.abs(u) < 0.03))
+    yes = int(np.count_nonzero(u >= 0.03))
+    no = len(pool) - yes - abstain
     passed = (yes / max(1, (yes+no))) >= threshold
     return yes, no, abstain, passed
 
-def propose_amendment(issue_vector: Dict[Issue, float], members: List[Member]) -> Dict[Issue, float]:
+def propose_amendment(iv_arr: np.ndarray, ideology: np.ndarray, step: float = 0.12) -> np.ndarray:
     # Simple "median pull": move each issue a bit toward the median member's ideology sign.
-    sorted_m = sorted(members, key=lambda m: m.ideology)
-    median = sorted_m[len(sorted_m)//2].ideology if sorted_m else 0.0
-    amended = dict(issue_vector)
-    for k, v in issue_vector.items():
-        # pull v toward 0 if median opposes the direction
-        step = 0.12
-        if (v > 0 and median < 0) or (v < 0 and median > 0):
-            amended[k] = v * (1 - step)
-        else:
-            amended[k] = max(-1.0, min(1.0, v + step * (0.0 if abs(v) < 0.2 else math.copysign(0.08, v))))
-    return amended
+    n = ideology.size
+    median = float(np.partition(ideology, n//2)[n//2]) if n else 0.0
+    # pull v toward 0 if median opposes the direction, otherwise nudge |v| >= 0.2 outward
+    opposed = iv_arr * median < 0
+    push = np.where(np.abs(iv_arr) < 0.2, 0.0, np.copysign(0.08, iv_arr))
+    return np.where(opposed, iv_arr * (1 - step), np.clip(iv_arr + step * push, -1.0, 1.0))
 
 async def run_simulation(
     districts: List[District],
@@ -78,32 +113,47 @@ async def run_simulation(
     issue_vector: Dict[Issue, float],
     use_llm: bool,
     llm_model: str,
-    seed: int | None
+    seed: int | None,
+    arrays: Optional[DistrictArrays] = None,
+    client: Optional[httpx.AsyncClient] = None,
 ):
-    rng = random.Random(seed)
+    # One Generator per request drives every draw: districts, ideology, speakers.
+    rng = np.random.default_rng(seed)
     if not districts:
         raise ValueError("No active districts are loaded.")
-    members = sample_members(districts, num_members, rng)
+    members = sample_members(districts, num_members, rng, arrays)
 
-    current = dict(issue_vector)
+    iv_arr = issue_array(issue_vector)
     all_rounds = []
+    llm_slots = asyncio.Semaphore(LLM_MAX_CONCURRENCY)
+
+    async def speak(member: Member, stance: str, current: Dict[Issue, float]) -> str:
+        async with llm_slots:
+            return await generate_speech(member, stance, current, use_llm=use_llm, llm_model=llm_model, client=client)
 
     for r in range(rounds):
-        spokes = pick_spokespeople(members, k=7)
-        speeches = []
+        current = issue_dict(iv_arr, issue_vector)
         # Determine stance by utility sign
-        for s in spokes:
-            u = s.utility(current)
+        spokes = []
+        for i in pick_spokespeople(members, rng, k=7):
+            contrib = rationale(members, i, iv_arr, current)
+            u = sum(contrib.values())
             stance = "support" if u > 0.05 else "oppose" if u < -0.05 else "amend"
-            txt = await generate_speech(s, stance, current, use_llm=use_llm, llm_model=llm_model)
-            speeches.append({
+            spokes.append((members.member(i, districts), stance, contrib))
+
+        # Speeches are independent I/O (Ollama when use_llm), so run them concurrently.
+        texts = await asyncio.gather(*[speak(s, stance, current) for s, stance, _ in spokes])
+        speeches = [
+            {
                 "member_id": s.member_id,
                 "stance": stance,
                 "text": txt,
-                "rationale": s.utility_by_issue(current),
-            })
+                "rationale": contrib,
+            }
+            for (s, stance, contrib), txt in zip(spokes, texts)
+        ]
 
-        yes, no, abstain, passed = vote(members, current, threshold=0.5)
+        yes, no, abstain, passed = vote(members, iv_arr, threshold=0.5)
         all_rounds.append({
             "round_index": r,
             "speeches": speeches,
@@ -115,7 +165,7 @@ async def run_simulation(
 
         # If it didn't pass and more rounds remain, amend toward median.
         if (not passed) and (r < rounds - 1):
-            current = propose_amendment(current, members)
+            iv_arr = propose_amendment(iv_arr, members.ideology)
 
     final_passed = all_rounds[-1]["vote"]["passed"] if all_rounds else False
     return {
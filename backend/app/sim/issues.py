@@ -0,0 +1,31 @@
+from enum import IntEnum
+from typing import Dict, Iterable, Literal, Tuple
+
+import numpy as np
+
+# JSON-facing issue names; only the API models and dict-shaped outputs use them.
+Issue = Literal["economy","climate","healthcare","immigration","education"]
+
+class IssueIdx(IntEnum):
+    """Column of each issue in issue arrays."""
+    ECONOMY = 0
+    CLIMATE = 1
+    HEALTHCARE = 2
+    IMMIGRATION = 3
+    EDUCATION = 4
+
+# Fixed column order for array-backed issue data: ISSUE_ORDER[IssueIdx.X] is X's name.
+ISSUE_ORDER: Tuple[Issue, ...] = ("economy", "climate", "healthcare", "immigration", "education")
+
+def issue_vec(values: Dict[Issue, float]) -> Tuple[float, ...]:
+    """Issue-keyed dict -> tuple in ISSUE_ORDER (missing issues are 0.0)."""
+    return tuple(float(values.get(k, 0.0)) for k in ISSUE_ORDER)
+
+def issue_array(values: Dict[Issue, float]) -> np.ndarray:
+    """Issue-keyed dict -> float64 array in ISSUE_ORDER (missing issues are 0.0)."""
+    return np.array([values.get(k, 0.0) for k in ISSUE_ORDER], dtype=np.float64)
+
+def issue_dict(arr: np.ndarray, issues: Iterable[str]) -> Dict[Issue, float]:
+    """Array -> issue dict, keeping only the given issues."""
+    values = arr.tolist()
+    return {k: values[j] for j, k in enumerate(ISSUE_ORDER) if k in issues}
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-import json
 import os
+import threading
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from .sim.agent import District, Issue
+import orjson
+
+from .sim.agent import District, DistrictArrays, Issue, district_arrays
 
 
 def _clamp(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
@@ -15,48 +17,81 @@ def _clamp(x: float, lo: float = -1.0, hi: float = 1.0) -> float:
 def load_mock_districts() -> List[District]:
     base_dir = os.path.dirname(__file__)
     path = os.path.join(base_dir, "data", "mock_districts.json")
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-
-    out: List[District] = []
-    for d in raw:
-        out.append(
-            District(
-                district_id=d["district_id"],
-                name=d.get("name", d["district_id"]),
-                state_fips=d.get("state_fips"),
-                cd=str(d.get("cd")) if d.get("cd") is not None else None,
-                lean=float(d.get("lean", 0.0)),
-                population=int(d.get("population", 0)),
-                demographics={k: float(v) for k, v in d.get("demographics", {}).items()},
-                weights={k: float(v) for k, v in d.get("weights", {}).items()},
-            )
+    with open(path, "rb") as f:
+        raw = orjson.loads(f.read())
+
+    # JSON integers decode as int; coerce so every weight/demographic is a float.
+    return [
+        District(
+            district_id=d["district_id"],
+            name=d.get("name", d["district_id"]),
+            state_fips=d.get("state_fips"),
+            cd=str(d.get("cd")) if d.get("cd") is not None else None,
+            lean=float(d.get("lean", 0.0)),
+            population=int(d.get("population", 0)),
+            demographics={k: float(v) for k, v in d.get("demographics", {}).items()},
+            weights={k: float(v) for k, v in d.get("weights", {}).items()},
         )
-    return out
+        for d in raw
+    ]
 
 
 # --- In-memory "active" configuration ---
 
 ACTIVE_SOURCE: str = "mock"  # 'mock' | 'acs' | 'synthetic'
 ACTIVE_META: Dict[str, Any] = {}
-ACTIVE_DISTRICTS: List[District] = load_mock_districts()
+# Populated on first use (or app startup) by ensure_loaded(), not at import time.
+ACTIVE_DISTRICTS: List[District] = []
+# ACTIVE_DISTRICTS with its array view for the vectorized simulation, published as
+# one tuple so a reader can never pair one set's districts with another set's arrays.
+ACTIVE_SNAPSHOT: Tuple[List[District], DistrictArrays] = (ACTIVE_DISTRICTS, district_arrays(ACTIVE_DISTRICTS))
+_LOADED = False
+_LOAD_LOCK = threading.Lock()
+# Summary payload and its encoded bytes, rebuilt by every set; readers never write them.
+_SUMMARY_CACHE: Optional[bytes] = None
+_SUMMARY_CACHE_JSON: Optional[Dict[str, Any]] = None
 
 
 def set_active_districts(districts: List[District], source: str, meta: Optional[Dict[str, Any]] = None) -> None:
-    global ACTIVE_SOURCE, ACTIVE_META, ACTIVE_DISTRICTS
+    global ACTIVE_SOURCE, ACTIVE_META, ACTIVE_DISTRICTS, ACTIVE_SNAPSHOT, _SUMMARY_CACHE, _SUMMARY_CACHE_JSON, _LOADED
+    meta = meta or {}
+    # Build everything derived before publishing, so a concurrent reader sees
+    # either the old set or the new one, never a mix.
+    arrays = district_arrays(districts)
+    summary = _build_summary(districts, len(districts), source, meta)
+    summary_bytes = orjson.dumps(summary)
     ACTIVE_SOURCE = source
-    ACTIVE_META = meta or {}
+    ACTIVE_META = meta
     ACTIVE_DISTRICTS = districts
+    ACTIVE_SNAPSHOT = (districts, arrays)
+    _SUMMARY_CACHE_JSON = summary
+    _SUMMARY_CACHE = summary_bytes
+    # Last, so ensure_loaded()'s unlocked fast path never sees a half-published set.
+    _LOADED = True
+
+
+def ensure_loaded() -> None:
+    """Load the mock districts once if nothing has been made active yet."""
+    if _LOADED:
+        return
+    with _LOAD_LOCK:
+        if not _LOADED:
+            set_active_districts(load_mock_districts(), source="mock", meta={})
 
 
 def get_active_districts() -> List[District]:
+    ensure_loaded()
     return list(ACTIVE_DISTRICTS)
 
 
-def get_active_summary(limit: Optional[int] = None) -> Dict[str, Any]:
-    ds = get_active_districts()
-    items = ds[:limit] if limit else ds
-    
+def get_active_snapshot() -> Tuple[List[District], DistrictArrays]:
+    """Active districts and their arrays, both from the same set_active_districts call."""
+    ensure_loaded()
+    districts, arrays = ACTIVE_SNAPSHOT
+    return list(districts), arrays
+
+
+def _build_summary(items: List[District], count: int, source: str, meta: Dict[str, Any]) -> Dict[str, Any]:
     # Serialize fully so the frontend can use them for simulation
     sample = [
         {
@@ -66,19 +101,32 @@ def get_active_summary(limit: Optional[int] = None) -> Dict[str, Any]:
             "cd": d.cd,
             "population": d.population,
             "lean": d.lean,
-            "weights": dict(d.weights),
-            "demographics": dict(d.demographics),
+            "weights": d.weights,
+            "demographics": d.demographics,
         }
         for d in items
     ]
     return {
-        "source": ACTIVE_SOURCE,
-        "meta": ACTIVE_META,
-        "count": len(ds),  # Total count
+        "source": source,
+        "meta": meta,
+        "count": count,  # Total count
         "sample": sample,  # Can be full list now
     }
 
 
+def get_active_summary(limit: Optional[int] = None) -> Dict[str, Any]:
+    ensure_loaded()
+    if limit:
+        return _build_summary(ACTIVE_DISTRICTS[:limit], len(ACTIVE_DISTRICTS), ACTIVE_SOURCE, ACTIVE_META)
+    return _SUMMARY_CACHE_JSON
+
+
+def get_active_summary_bytes() -> bytes:
+    """Full summary as JSON bytes, encoded once per set_active_districts."""
+    ensure_loaded()
+    return _SUMMARY_CACHE
+
+
 def serialize_districts(ds: List[District]) -> List[Dict[str, Any]]:
     # For debugging / UI preview.
     return [